@@ -0,0 +1,29 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView.
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+from UM.Application import Application
+from UM.Operations.GroupedOperation import GroupedOperation
+from UM.Signal import postponeSignals, CompressTechnique
+
+##  Grouped operation that postpones the scene change signals until all of its operations have been applied.
+#
+#   Each scene node is then reported as changed once, instead of once for every change made to it by the operations.
+class BatchedGroupedOperation(GroupedOperation):
+    ##  Undoes all operations, in reverse order.
+    def undo(self) -> None:
+        with postponeSignals(self._getSceneChangedSignal(), compress = CompressTechnique.CompressPerParameterValue):
+            super().undo()
+
+    ##  Redoes all operations.
+    def redo(self) -> None:
+        with postponeSignals(self._getSceneChangedSignal(), compress = CompressTechnique.CompressPerParameterValue):
+            super().redo()
+
+    def _getSceneChangedSignal(self):
+        return Application.getInstance().getController().getScene().sceneChanged
+
+    ##  Returns a programmer-readable representation of this operation.
+    #
+    #   A programmer-readable representation of this operation.
+    def __repr__(self) -> str:
+        return "BatchedGroupedOperation(operations = {0})".format(self.getNumChildrenOperations())
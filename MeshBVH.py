@@ -0,0 +1,256 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+import numpy
+
+from typing import List, Tuple
+
+##  Bounding volume hierarchy over the faces of a triangle mesh.
+#
+#   The faces are sorted along a Morton (Z-order) curve and grouped into leaves of a fixed number of faces.
+#   The tree is then built bottom-up by merging pairs of nodes, so it is balanced and can be stored as one
+#   array of bounds per level. This allows both building and traversing the tree with vectorized numpy
+#   operations instead of recursing through the nodes in Python.
+class MeshBVH:
+    ##  Builds the hierarchy.
+    #
+    #   \param vertices The vertices of the mesh, as an (n, 3) array.
+    #   \param faces The indices of the vertices of each face, as an (m, 3) array.
+    #   \param leaf_size The number of faces in each leaf of the tree.
+    def __init__(self, vertices: numpy.ndarray, faces: numpy.ndarray, leaf_size: int = 4) -> None:
+        self._leaf_size = leaf_size
+
+        faces = numpy.asarray(faces, dtype=numpy.int64)
+        triangles = numpy.asarray(vertices, dtype=numpy.float64)[faces]
+
+        # All per-face data is stored in the order of the leaves; _order maps back to the original face indices
+        self._order = numpy.argsort(_mortonCodes(triangles.mean(axis=1)), kind="stable")
+        self._face_vertices = numpy.ascontiguousarray(faces[self._order].T)
+        self._triangles = triangles[self._order]
+        # Bounds are stored per axis, which makes gathering them for many pairs of boxes considerably faster
+        self._face_mins = numpy.ascontiguousarray(self._triangles.min(axis=1).T)
+        self._face_maxs = numpy.ascontiguousarray(self._triangles.max(axis=1).T)
+
+        self._level_mins = []  # type: List[numpy.ndarray]
+        self._level_maxs = []  # type: List[numpy.ndarray]
+        if len(faces) == 0:
+            return
+
+        # Pad the last leaf with copies of the last face, so all leaves can be reduced at once
+        leaf_count = -(-len(faces) // leaf_size)
+        padding = leaf_count * leaf_size - len(faces)
+        mins = numpy.concatenate([self._face_mins, numpy.repeat(self._face_mins[:, -1:], padding, axis=1)], axis=1)
+        maxs = numpy.concatenate([self._face_maxs, numpy.repeat(self._face_maxs[:, -1:], padding, axis=1)], axis=1)
+        mins = mins.reshape(3, leaf_count, leaf_size).min(axis=2)
+        maxs = maxs.reshape(3, leaf_count, leaf_size).max(axis=2)
+        self._level_mins.append(mins)
+        self._level_maxs.append(maxs)
+
+        # Node i of a level has children 2i and 2i+1 in the level below it; an odd node out has a single child
+        while mins.shape[1] > 1:
+            paired_count = mins.shape[1] - mins.shape[1] % 2
+            new_mins = numpy.minimum(mins[:, 0:paired_count:2], mins[:, 1:paired_count:2])
+            new_maxs = numpy.maximum(maxs[:, 0:paired_count:2], maxs[:, 1:paired_count:2])
+            if paired_count < mins.shape[1]:
+                new_mins = numpy.concatenate([new_mins, mins[:, -1:]], axis=1)
+                new_maxs = numpy.concatenate([new_maxs, maxs[:, -1:]], axis=1)
+            mins = new_mins
+            maxs = new_maxs
+            self._level_mins.append(mins)
+            self._level_maxs.append(maxs)
+
+    ##  Finds the faces of the mesh that intersect other faces of the same mesh.
+    #
+    #   Faces that share a vertex are not tested against each other, so the mesh should have merged vertices.
+    #   Coplanar overlapping faces are not detected.
+    #
+    #   \param chunk_size The number of pairs of leaves to test at once, to limit the memory use.
+    #   \return The sorted indices of the intersecting faces.
+    def selfIntersectingFaces(self, chunk_size: int = 65536) -> numpy.ndarray:
+        if not self._level_mins:
+            return numpy.zeros(0, dtype=numpy.int64)
+
+        leaves_a, leaves_b = self._overlappingLeafPairs()
+
+        offsets = numpy.arange(self._leaf_size)
+        face_count = len(self._order)
+        intersecting = numpy.zeros(face_count, dtype=bool)
+
+        for start in range(0, len(leaves_a), chunk_size):
+            chunk_a = leaves_a[start:start + chunk_size]
+            chunk_b = leaves_b[start:start + chunk_size]
+
+            # All combinations of the faces in each pair of leaves
+            faces_a = (chunk_a[:, numpy.newaxis, numpy.newaxis] * self._leaf_size + offsets[numpy.newaxis, :, numpy.newaxis])
+            faces_b = (chunk_b[:, numpy.newaxis, numpy.newaxis] * self._leaf_size + offsets[numpy.newaxis, numpy.newaxis, :])
+            faces_a, faces_b = numpy.broadcast_arrays(faces_a, faces_b)
+            # Within a single leaf, test each pair only once
+            valid = (faces_a < face_count) & (faces_b < face_count) & ((chunk_a != chunk_b)[:, numpy.newaxis, numpy.newaxis] | (faces_a < faces_b))
+            faces_a = faces_a[valid]
+            faces_b = faces_b[valid]
+
+            faces_a, faces_b = _overlappingPairs(self._face_mins, self._face_maxs, faces_a, faces_b)
+
+            shares_vertex = numpy.zeros(len(faces_a), dtype=bool)
+            vertices_a = [self._face_vertices[i][faces_a] for i in range(3)]
+            vertices_b = [self._face_vertices[i][faces_b] for i in range(3)]
+            for vertex_a in vertices_a:
+                for vertex_b in vertices_b:
+                    shares_vertex |= vertex_a == vertex_b
+            faces_a = faces_a[~shares_vertex]
+            faces_b = faces_b[~shares_vertex]
+
+            hits = _trianglesIntersect(self._triangles[faces_a], self._triangles[faces_b])
+            intersecting[faces_a[hits]] = True
+            intersecting[faces_b[hits]] = True
+
+        return numpy.sort(self._order[intersecting])
+
+    ##  Finds the nearest intersection of rays with the faces of the mesh.
+    #
+    #   All rays are traversed through the tree together, one level at a time.
+    #   \param origins The origins of the rays, as an (n, 3) array.
+    #   \param directions The normalised directions of the rays, as an (n, 3) array.
+    #   \param max_distance The distance beyond which faces are ignored. Limiting the distance allows skipping large
+    #   parts of the tree.
+    #   \return The distance along each ray to the nearest face in front of its origin, or infinity if the ray does
+    #   not hit any face within the maximum distance.
+    def intersectRays(self, origins: numpy.ndarray, directions: numpy.ndarray, max_distance: float = numpy.inf) -> numpy.ndarray:
+        distances = numpy.full(len(origins), numpy.inf)
+        if not self._level_mins or len(origins) == 0:
+            return distances
+
+        # Avoid dividing by zero for rays that are parallel to an axis
+        safe_directions = numpy.where(numpy.abs(directions) < 1e-12, numpy.copysign(1e-12, directions), directions)
+        inverse_directions = numpy.ascontiguousarray((1.0 / safe_directions).T)
+        transposed_origins = numpy.ascontiguousarray(origins.T)
+
+        top_level = len(self._level_mins) - 1
+        rays = numpy.arange(len(origins))
+        nodes = numpy.zeros(len(origins), dtype=numpy.int64)
+        rays, nodes = _raysHittingBoxes(transposed_origins, inverse_directions, self._level_mins[top_level], self._level_maxs[top_level], rays, nodes, max_distance)
+
+        for level in range(top_level, 0, -1):
+            mins = self._level_mins[level - 1]
+            maxs = self._level_maxs[level - 1]
+
+            children = numpy.concatenate([2 * nodes, 2 * nodes + 1])
+            rays = numpy.concatenate([rays, rays])
+            valid = children < mins.shape[1]
+            rays, nodes = _raysHittingBoxes(transposed_origins, inverse_directions, mins, maxs, rays[valid], children[valid], max_distance)
+
+        # Test the rays against all faces of the leaves they hit
+        faces = (nodes[:, numpy.newaxis] * self._leaf_size + numpy.arange(self._leaf_size)).ravel()
+        rays = numpy.repeat(rays, self._leaf_size)
+        valid = faces < len(self._order)
+        faces = faces[valid]
+        rays = rays[valid]
+
+        face_distances = _intersectRaysTriangles(origins[rays], directions[rays], self._triangles[faces])
+        face_distances[face_distances > max_distance] = numpy.inf
+        numpy.minimum.at(distances, rays, face_distances)
+        return distances
+
+    ##  Traverses the tree against itself, to find all pairs of leaves with overlapping bounds.
+    #
+    #   Both sides of each pair of nodes are always on the same level, so each level is handled in one step.
+    #   \return Two arrays with the indices of the leaves in each pair, where the first leaf <= the second leaf.
+    def _overlappingLeafPairs(self) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        nodes_a = numpy.zeros(1, dtype=numpy.int64)
+        nodes_b = numpy.zeros(1, dtype=numpy.int64)
+
+        for level in range(len(self._level_mins) - 1, 0, -1):
+            mins = self._level_mins[level - 1]
+            maxs = self._level_maxs[level - 1]
+
+            children_a = numpy.concatenate([2 * nodes_a, 2 * nodes_a, 2 * nodes_a + 1, 2 * nodes_a + 1])
+            children_b = numpy.concatenate([2 * nodes_b, 2 * nodes_b + 1, 2 * nodes_b, 2 * nodes_b + 1])
+            valid = (children_a <= children_b) & (children_b < mins.shape[1])
+            nodes_a, nodes_b = _overlappingPairs(mins, maxs, children_a[valid], children_b[valid])
+
+        return nodes_a, nodes_b
+
+
+##  Filters pairs of boxes down to the pairs that overlap.
+#
+#   The bounds of the boxes are passed as (3, n) arrays. The test is done one axis at a time, so each following axis only has to look at the remaining pairs.
+def _overlappingPairs(mins: numpy.ndarray, maxs: numpy.ndarray, indices_a: numpy.ndarray, indices_b: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    for axis in range(3):
+        overlapping = (mins[axis][indices_a] <= maxs[axis][indices_b]) & (mins[axis][indices_b] <= maxs[axis][indices_a])
+        indices_a = indices_a[overlapping]
+        indices_b = indices_b[overlapping]
+    return indices_a, indices_b
+
+
+##  Filters pairs of rays and boxes down to the pairs where the ray hits the box in front of its origin and within
+#   the maximum distance (slab test).
+#
+#   The origins, inverse directions and bounds of the boxes are passed as (3, n) arrays.
+def _raysHittingBoxes(origins: numpy.ndarray, inverse_directions: numpy.ndarray, mins: numpy.ndarray, maxs: numpy.ndarray, rays: numpy.ndarray, boxes: numpy.ndarray, max_distance: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    entry = numpy.zeros(len(rays))
+    exit = numpy.full(len(rays), max_distance)
+    for axis in range(3):
+        ray_origins = origins[axis][rays]
+        ray_inverse_directions = inverse_directions[axis][rays]
+        near = (mins[axis][boxes] - ray_origins) * ray_inverse_directions
+        far = (maxs[axis][boxes] - ray_origins) * ray_inverse_directions
+        entry = numpy.maximum(entry, numpy.minimum(near, far))
+        exit = numpy.minimum(exit, numpy.maximum(near, far))
+    hit = entry <= exit
+    return rays[hit], boxes[hit]
+
+
+##  Computes 30 bit Morton codes for points, normalised to their bounding box.
+def _mortonCodes(points: numpy.ndarray) -> numpy.ndarray:
+    if len(points) == 0:
+        return numpy.zeros(0, dtype=numpy.uint64)
+
+    mins = points.min(axis=0)
+    size = numpy.maximum(points.max(axis=0) - mins, 1e-12)
+    quantised = ((points - mins) / size * 1023).astype(numpy.uint64)
+
+    codes = numpy.zeros(len(points), dtype=numpy.uint64)
+    for axis in range(3):
+        spread = quantised[:, axis]
+        spread = (spread | (spread << numpy.uint64(16))) & numpy.uint64(0x030000FF)
+        spread = (spread | (spread << numpy.uint64(8))) & numpy.uint64(0x0300F00F)
+        spread = (spread | (spread << numpy.uint64(4))) & numpy.uint64(0x030C30C3)
+        spread = (spread | (spread << numpy.uint64(2))) & numpy.uint64(0x09249249)
+        codes |= spread << numpy.uint64(2 - axis)
+    return codes
+
+
+##  Intersects rays or segments with triangles, one triangle per ray (Möller-Trumbore).
+#
+#   \param origins The origins of the rays, as an (n, 3) array.
+#   \param directions The directions of the rays, as an (n, 3) array. These do not need to be normalised.
+#   \param triangles The triangles, as an (n, 3, 3) array.
+#   \return The distance along each ray to the intersection in multiples of the direction, or infinity if there
+#   is no intersection in front of the origin.
+def _intersectRaysTriangles(origins: numpy.ndarray, directions: numpy.ndarray, triangles: numpy.ndarray) -> numpy.ndarray:
+    edges_1 = triangles[:, 1] - triangles[:, 0]
+    edges_2 = triangles[:, 2] - triangles[:, 0]
+
+    p = numpy.cross(directions, edges_2)
+    determinants = numpy.einsum("ij,ij->i", edges_1, p)
+    parallel = numpy.abs(determinants) < 1e-12
+    inverse_determinants = 1.0 / numpy.where(parallel, 1.0, determinants)
+
+    t = origins - triangles[:, 0]
+    u = numpy.einsum("ij,ij->i", t, p) * inverse_determinants
+    q = numpy.cross(t, edges_1)
+    v = numpy.einsum("ij,ij->i", directions, q) * inverse_determinants
+    distances = numpy.einsum("ij,ij->i", edges_2, q) * inverse_determinants
+
+    hit = ~parallel & (u >= 0) & (v >= 0) & (u + v <= 1) & (distances > 0)
+    return numpy.where(hit, distances, numpy.inf)
+
+
+##  Tests pairs of triangles for intersection, by testing each edge of either triangle against the other triangle.
+def _trianglesIntersect(triangles_a: numpy.ndarray, triangles_b: numpy.ndarray) -> numpy.ndarray:
+    result = numpy.zeros(len(triangles_a), dtype=bool)
+    for edges_of, other in ((triangles_a, triangles_b), (triangles_b, triangles_a)):
+        for start, end in ((0, 1), (1, 2), (2, 0)):
+            distances = _intersectRaysTriangles(edges_of[:, start], edges_of[:, end] - edges_of[:, start], other)
+            result |= distances < 1
+    return result
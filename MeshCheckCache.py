@@ -0,0 +1,125 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+from UM.Logger import Logger
+from UM.Mesh.MeshData import MeshData
+
+import hashlib
+import json
+import sqlite3
+import time
+
+from typing import Any, Dict, Optional, Tuple
+
+##  Persistent cache of the results of checking meshes, so unchanged files do not have to be checked again.
+#
+#   Results are stored in a SQLite database, keyed by the file name and a hash of the mesh buffers.
+#   The least recently used results are removed when the cache holds more than a maximum number of results.
+#   To avoid a commit for every lookup, the times at which results are used are stored in batches by storeUsage().
+class MeshCheckCache:
+    ##  Creates the cache.
+    #
+    #   \param path The path of the database file.
+    #   \param max_entries The maximum number of results to keep.
+    def __init__(self, path: str, max_entries: int = 10000) -> None:
+        self._path = path
+        self._max_entries = max_entries
+
+        self._connection = None  # type: Optional[sqlite3.Connection]
+        self._used_results = {}  # type: Dict[Tuple[str, str], float]
+        self._failed = False
+
+    ##  Computes a hash of the vertex and index buffers of a mesh.
+    @staticmethod
+    def getMeshHash(mesh_data: MeshData) -> str:
+        mesh_hash = hashlib.sha1()
+        vertices = mesh_data.getVertices()
+        if vertices is not None:
+            mesh_hash.update(str(vertices.shape).encode())
+            mesh_hash.update(vertices.tobytes())
+        indices = mesh_data.getIndices()
+        if indices is not None:
+            mesh_hash.update(str(indices.shape).encode())
+            mesh_hash.update(indices.tobytes())
+        return mesh_hash.hexdigest()
+
+    ##  Gets the stored result for a mesh, or None if the mesh has not been checked before.
+    def getResult(self, file_name: str, mesh_hash: str) -> Optional[Dict[str, Any]]:
+        connection = self._getConnection()
+        if not connection:
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT result FROM mesh_checks WHERE file_name = ? AND mesh_hash = ?",
+                (file_name, mesh_hash)
+            ).fetchone()
+            if row is None:
+                return None
+            self._used_results[(file_name, mesh_hash)] = time.time()
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            Logger.log("w", "Could not read mesh check result from cache: %s" % str(e))
+            return None
+
+    ##  Stores the result for a mesh, replacing any previous result for the same file and mesh.
+    def setResult(self, file_name: str, mesh_hash: str, result: Dict[str, Any]) -> None:
+        connection = self._getConnection()
+        if not connection:
+            return
+
+        self._used_results.pop((file_name, mesh_hash), None)
+        try:
+            self._updateLastUsed(connection)
+            connection.execute(
+                "INSERT OR REPLACE INTO mesh_checks (file_name, mesh_hash, result, last_used) VALUES (?, ?, ?, ?)",
+                (file_name, mesh_hash, json.dumps(result), time.time())
+            )
+            connection.execute(
+                "DELETE FROM mesh_checks WHERE rowid IN "
+                "(SELECT rowid FROM mesh_checks ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self._max_entries, )
+            )
+            connection.commit()
+        except sqlite3.Error as e:
+            Logger.log("w", "Could not store mesh check result in cache: %s" % str(e))
+
+    ##  Stores the times at which results were used since the last time the cache was written to, in a single commit.
+    def storeUsage(self) -> None:
+        if not self._used_results:
+            return
+        connection = self._getConnection()
+        if not connection:
+            return
+
+        try:
+            self._updateLastUsed(connection)
+            connection.commit()
+        except sqlite3.Error as e:
+            Logger.log("w", "Could not store mesh check usage in cache: %s" % str(e))
+
+    def _updateLastUsed(self, connection: sqlite3.Connection) -> None:
+        used_results = [(last_used, file_name, mesh_hash) for (file_name, mesh_hash), last_used in self._used_results.items()]
+        self._used_results = {}
+        connection.executemany(
+            "UPDATE mesh_checks SET last_used = ? WHERE file_name = ? AND mesh_hash = ?",
+            used_results
+        )
+
+    def _getConnection(self) -> Optional[sqlite3.Connection]:
+        if self._connection or self._failed:
+            return self._connection
+
+        try:
+            self._connection = sqlite3.connect(self._path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS mesh_checks "
+                "(file_name TEXT, mesh_hash TEXT, result TEXT, last_used REAL, PRIMARY KEY (file_name, mesh_hash))"
+            )
+            self._connection.commit()
+        except sqlite3.Error as e:
+            Logger.log("w", "Could not open mesh check cache %s: %s" % (self._path, str(e)))
+            self._connection = None
+            self._failed = True
+
+        return self._connection
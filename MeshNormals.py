@@ -0,0 +1,45 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+import numpy
+
+from typing import Optional
+
+##  Calculates the normals of the vertices of an indexed mesh.
+#
+#   The normal of a vertex is the area weighted average of the normals of the faces that use it, so meshes with
+#   shared vertices get smooth normals and meshes with separate vertices per face get the normal of their face.
+#   Unlike calculateNormalsFromIndexedVertices in Uranium, this does not loop over the faces in Python.
+#   \param vertices The vertices of the mesh, as an (n, 3) array.
+#   \param indices The indices of the vertices of each face, as an (m, 3) array.
+#   \param faces Optional indices of the changed faces. If these are passed along with the current normals, only
+#   the normals of the vertices of these faces are calculated.
+#   \param normals The current normals of the vertices, which are copied for the vertices of unchanged faces.
+#   \return The normals of the vertices, as an (n, 3) array.
+def calculateVertexNormals(vertices: numpy.ndarray, indices: numpy.ndarray, faces: Optional[numpy.ndarray] = None, normals: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    vertex_count = len(vertices)
+    if faces is not None and normals is not None and len(normals) == vertex_count:
+        affected_vertices = numpy.zeros(vertex_count, dtype=bool)
+        affected_vertices[indices[faces].ravel()] = True
+        # all faces that use an affected vertex contribute to its normal, not just the changed faces
+        indices = indices[affected_vertices[indices].any(axis=1)]
+        result = numpy.array(normals, dtype=numpy.float32)
+    else:
+        affected_vertices = numpy.ones(vertex_count, dtype=bool)
+        result = numpy.zeros((vertex_count, 3), dtype=numpy.float32)
+
+    triangles = numpy.asarray(vertices, dtype=numpy.float64)[indices]
+    # the length of the cross product is twice the area of the face, which weighs the average by area
+    face_normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+
+    corner_indices = indices.ravel()
+    vertex_normals = numpy.empty((vertex_count, 3))
+    for axis in range(3):
+        vertex_normals[:, axis] = numpy.bincount(corner_indices, weights=numpy.repeat(face_normals[:, axis], 3), minlength=vertex_count)
+
+    lengths = numpy.linalg.norm(vertex_normals, axis=1)
+    lengths[lengths == 0] = 1
+    vertex_normals /= lengths[:, numpy.newaxis]
+
+    result[affected_vertices] = vertex_normals[affected_vertices]
+    return result
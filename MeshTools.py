@@ -22,7 +22,6 @@ from UM.Logger import Logger
 
 from UM.Scene.Selection import Selection
 from UM.Scene.SceneNode import SceneNode
-from UM.Operations.GroupedOperation import GroupedOperation
 from UM.Operations.AddSceneNodeOperation import AddSceneNodeOperation
 from UM.Operations.RemoveSceneNodeOperation import RemoveSceneNodeOperation
 from UM.Operations.SetTransformOperation import SetTransformOperation
@@ -37,9 +36,15 @@ from UM.Math.Matrix import Matrix
 from UM.Resources import Resources
 from UM.i18n import i18nCatalog
 
+from .MeshNormals import calculateVertexNormals
 from .SetTransformMatrixOperation import SetTransformMatrixOperation
 from .SetParentOperationSimplified import SetParentOperationSimplified
 from .SetMeshDataAndNameOperation import SetMeshDataAndNameOperation
+from .BatchedGroupedOperation import BatchedGroupedOperation
+from .SelfIntersectionJob import SelfIntersectionJob
+from .MeshCheckCache import MeshCheckCache
+from .ReadBinaryStlJob import ReadBinaryStlJob
+from .WallThicknessJob import WallThicknessJob
 
 import os
 import sys
@@ -47,7 +52,9 @@ import numpy
 import trimesh
 import random
 
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Any, Callable, Optional, List, Dict, Tuple
 
 Resources.addSearchPath(
     os.path.join(
@@ -79,6 +86,10 @@ class MeshTools(Extension, QObject,):
         self._node_queue = []  # type: List[SceneNode]
         self._mesh_not_watertight_messages = {}  # type: Dict[str, Message]
 
+        self._wall_thickness_job = None  # type: Optional[WallThicknessJob]
+
+        self._check_cache = MeshCheckCache(os.path.join(Resources.getDataStoragePath(), "meshtools_check_cache.db"))
+
         self._settings_dialog = None
         self._rename_dialog = None
 
@@ -87,6 +98,11 @@ class MeshTools(Extension, QObject,):
         self._preferences.addPreference("meshtools/fix_normals_on_load", False)
         self._preferences.addPreference("meshtools/randomise_location_on_load", False)
         self._preferences.addPreference("meshtools/model_unit_factor", 1)
+        self._preferences.addPreference("meshtools/fragment_min_faces", 0)
+        self._preferences.addPreference("meshtools/fragment_min_volume", 0)
+        self._preferences.addPreference("meshtools/fragment_min_size", 0)
+        self._preferences.addPreference("meshtools/merge_fragments", False)
+        self._preferences.addPreference("meshtools/minimum_wall_thickness", 0.8)
 
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Reload model"), self.reloadMesh)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Rename model..."), self.renameMesh)
@@ -94,9 +110,13 @@ class MeshTools(Extension, QObject,):
         self.addMenuItem("", lambda: None)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Check models"), self.checkMeshes)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Analyse models"), self.analyseMeshes)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Check models for self-intersections"), self.checkSelfIntersections)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Analyse wall thickness"), self.analyseWallThickness)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Fix simple holes"), self.fixSimpleHolesForMeshes)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Fix model normals"), self.fixNormalsForMeshes)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Split model into parts"), self.splitMeshes)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Remove small fragments"), self.removeFragmentsFromMeshes)
+        self.addMenuItem(catalog.i18nc("@item:inmenu", "Combine models into single mesh"), self.combineMeshes)
         self.addMenuItem(" ", lambda: None)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Randomise location"), self.randomiseMeshLocation)
         self.addMenuItem(catalog.i18nc("@item:inmenu", "Apply transformations to mesh"), self.bakeMeshTransformation)
@@ -202,14 +222,34 @@ class MeshTools(Extension, QObject,):
                 position = self._randomLocation(node_bounds, max_x_coordinate, max_y_coordinate)
                 node.setPosition(position)
 
+            check_result = None  # type: Optional[Dict[str, Any]]
+            tri_node = None  # type: Optional[trimesh.base.Trimesh]
             if (
                 self._preferences.getValue("meshtools/check_models_on_load") or
                 self._preferences.getValue("meshtools/fix_normals_on_load") or
                 self._preferences.getValue("meshtools/model_unit_factor") != 1
             ):
-
-                tri_node = self._toTriMesh(mesh_data)
-
+                # reuse the results of previous sessions for files that have not changed
+                cache_key = file_name if file_name else ""
+                mesh_hash = MeshCheckCache.getMeshHash(mesh_data)
+                check_result = self._check_cache.getResult(cache_key, mesh_hash)
+
+                if (
+                    check_result is None or
+                    self._preferences.getValue("meshtools/model_unit_factor") != 1 or
+                    (
+                        self._preferences.getValue("meshtools/fix_normals_on_load") and
+                        check_result["is_watertight"] and
+                        check_result.get("needs_normals_fix") is not False
+                    )
+                ):
+                    tri_node = self._toTriMesh(mesh_data)
+
+                if check_result is None:
+                    check_result = self._checkTriMesh(tri_node)
+                    self._check_cache.setResult(cache_key, mesh_hash, check_result)
+
+            tri_node_scaled = False
             if self._preferences.getValue("meshtools/model_unit_factor") != 1:
                 if file_name and os.path.splitext(file_name)[1].lower() not in [".stl", ".obj", ".ply"]:
                     # only resize models that don't have an intrinsic unit set
@@ -218,10 +258,9 @@ class MeshTools(Extension, QObject,):
                 scale_matrix = Matrix()
                 scale_matrix.setByScaleFactor(float(self._preferences.getValue("meshtools/model_unit_factor")))
                 tri_node.apply_transform(scale_matrix.getData())
+                tri_node_scaled = True
 
-                self._replaceSceneNode(node, [tri_node])
-
-            if self._preferences.getValue("meshtools/check_models_on_load") and not tri_node.is_watertight:
+            if self._preferences.getValue("meshtools/check_models_on_load") and not check_result["is_watertight"]:
                 if not file_name:
                     file_name = catalog.i18nc("@text Print job name", "Untitled")
                 base_name = os.path.basename(file_name)
@@ -246,10 +285,18 @@ class MeshTools(Extension, QObject,):
 
                 self._mesh_not_watertight_messages[file_name] = message
 
-            if self._preferences.getValue("meshtools/fix_normals_on_load") and tri_node.is_watertight:
-                tri_node.fix_normals()
+            flipped_faces = None  # type: Optional[numpy.ndarray]
+            if self._preferences.getValue("meshtools/fix_normals_on_load") and check_result["is_watertight"] and tri_node is not None:
+                flipped_faces = self._fixNormals(tri_node)
+                check_result["needs_normals_fix"] = bool(numpy.any(flipped_faces))
+                self._check_cache.setResult(cache_key, mesh_hash, check_result)
+
+            if tri_node_scaled or (flipped_faces is not None and len(tri_node.faces) != mesh_data.getFaceCount()):
                 self._replaceSceneNode(node, [tri_node])
+            elif flipped_faces is not None and numpy.any(flipped_faces):
+                node.setMeshData(self._flipMeshDataFaces(mesh_data, flipped_faces))
 
+        self._check_cache.storeUsage()
         self._node_queue = []
 
     def _showXRayView(self, message, action) -> None:
@@ -307,24 +354,42 @@ class MeshTools(Extension, QObject,):
 
     @pyqtSlot()
     def checkMeshes(self) -> None:
-        nodes_list = self._getAllSelectedNodes()
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
         if not nodes_list:
             return
 
         message_body = catalog.i18nc("@info:status", "Check summary:")
         for node in nodes_list:
-            tri_node = self._toTriMesh(node.getMeshData())
+            mesh_data = node.getMeshData()
+            cache_key = mesh_data.getFileName() or ""
+            mesh_hash = MeshCheckCache.getMeshHash(mesh_data)
+            check_result = self._check_cache.getResult(cache_key, mesh_hash)
+            if check_result is None:
+                check_result = self._checkTriMesh(self._toTriMesh(mesh_data))
+                self._check_cache.setResult(cache_key, mesh_hash, check_result)
+
             message_body = message_body + "\n - %s" % node.getName()
-            if tri_node.is_watertight:
+            if check_result["is_watertight"]:
                 message_body = message_body + " " + catalog.i18nc("@info:status", "is watertight")
             else:
                 message_body = message_body + " " + catalog.i18nc("@info:status", "is not watertight and may not print properly")
-            if tri_node.body_count > 1:
-                message_body = message_body + " " + catalog.i18nc("@info:status", "and consists of {body_count} submeshes").format(body_count = tri_node.body_count)
+            if check_result["body_count"] > 1:
+                message_body = message_body + " " + catalog.i18nc("@info:status", "and consists of {body_count} submeshes").format(body_count = check_result["body_count"])
+        self._check_cache.storeUsage()
 
         self._message.setText(message_body)
         self._message.show()
 
+    ##  Checks a mesh, returning the result in the form that is stored in the check cache.
+    def _checkTriMesh(self, tri_node: trimesh.base.Trimesh) -> Dict[str, Any]:
+        is_watertight = tri_node.is_watertight
+        return {
+            "is_watertight": is_watertight,
+            "body_count": int(tri_node.body_count),
+            "volume": float(tri_node.volume) if is_watertight else None,
+            "area": float(tri_node.area)
+        }
+
     @pyqtSlot()
     def analyseMeshes(self) -> None:
         nodes_list = self._getAllSelectedNodes()
@@ -342,33 +407,179 @@ class MeshTools(Extension, QObject,):
         self._message.setText(message_body)
         self._message.show()
 
+    @pyqtSlot()
+    def checkSelfIntersections(self) -> None:
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
+        if not nodes_list:
+            return
+
+        self._message.setText(catalog.i18nc("@info:status", "Checking for self-intersections..."))
+        self._message.show()
+
+        job = SelfIntersectionJob(self._groupNodesByMeshData(nodes_list), self._toTriMesh)
+        job.finished.connect(self._selfIntersectionFinished)
+        job.start()
+
+    def _selfIntersectionFinished(self, job) -> None:
+        self._message.hide()
+
+        has_intersections = False
+        message_body = catalog.i18nc("@info:status", "Self-intersection summary:")
+        for node, intersecting_faces in job.getResult().items():
+            message_body = message_body + "\n - %s" % node.getName()
+            if len(intersecting_faces) > 0:
+                has_intersections = True
+                message_body = message_body + " " + catalog.i18nc("@info:status", "has %d intersecting faces") % len(intersecting_faces)
+            else:
+                message_body = message_body + " " + catalog.i18nc("@info:status", "has no intersecting faces")
+
+        message = Message(title=catalog.i18nc("@info:title", "Mesh Tools"))
+        # X-Ray view shows the areas where shells overlap or intersect
+        active_view = self._controller.getActiveView()
+        if has_intersections and active_view and "XRayView" in self._controller.getAllViews() and active_view.getPluginId() != "XRayView":
+            message.addAction("X-Ray", catalog.i18nc("@action:button", "Show X-Ray View"), "", "")
+            message.actionTriggered.connect(self._showXRayView)
+
+        message.setText(message_body)
+        message.show()
+
+    @pyqtSlot()
+    def analyseWallThickness(self) -> None:
+        if self._wall_thickness_job:
+            self._message.setText(catalog.i18nc("@info:status", "The wall thickness analysis is already running"))
+            self._message.show()
+            return
+
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
+        if not nodes_list:
+            return
+
+        threshold = float(self._preferences.getValue("meshtools/minimum_wall_thickness"))
+        if threshold <= 0:
+            self._message.setText(catalog.i18nc("@info:status", "Please set a minimum wall thickness larger than 0 first"))
+            self._message.show()
+            return
+
+        progress_message = Message(
+            catalog.i18nc("@info:status", "Analysing wall thickness..."),
+            lifetime=0, dismissable=False, progress=0, title=catalog.i18nc("@info:title", "Mesh Tools")
+        )
+        progress_message.addAction("Cancel", catalog.i18nc("@action:button", "Cancel"), "", "")
+        progress_message.actionTriggered.connect(self._onWallThicknessMessageAction)
+        progress_message.show()
+
+        self._wall_thickness_job = WallThicknessJob(nodes_list, threshold, progress_message)
+        self._wall_thickness_job.finished.connect(self._wallThicknessFinished)
+        self._wall_thickness_job.start()
+
+    def _onWallThicknessMessageAction(self, message, action) -> None:
+        if action == "Cancel" and self._wall_thickness_job:
+            self._wall_thickness_job.abort()
+        message.hide()
+
+    def _wallThicknessFinished(self, job) -> None:
+        self._wall_thickness_job = None
+        progress_message = job.getMessage()
+        if progress_message:
+            progress_message.hide()
+
+        job_result = job.getResult()
+        if job_result is None:
+            # the analysis was cancelled
+            return
+
+        threshold = job.getThreshold()
+        maximum_thickness = job.getMaximumThickness()
+
+        def formatThickness(thickness: float) -> str:
+            if thickness > maximum_thickness:
+                return "> %.1f mm" % maximum_thickness
+            return "%.2f mm" % thickness
+
+        message_body = catalog.i18nc("@info:status", "Wall thickness summary:")
+        for node, statistics in job_result.items():
+            message_body = message_body + "\n - %s:" % node.getName()
+            if statistics["sample_count"] == 0:
+                message_body += " " + catalog.i18nc("@info:status", "has no faces to analyse")
+                continue
+            message_body += "\n\t" + catalog.i18nc("@info:status", "minimum: %s, 5%%: %s, 25%%: %s, median: %s") % (
+                formatThickness(statistics["minimum"]),
+                formatThickness(statistics["percentiles"][5]),
+                formatThickness(statistics["percentiles"][25]),
+                formatThickness(statistics["percentiles"][50])
+            )
+            if statistics["thin_area"] > 0:
+                message_body += "\n\t" + catalog.i18nc("@info:status", "%d mm2 (%.1f%%) of the surface is thinner than %.2f mm") % (
+                    statistics["thin_area"], 100 * statistics["thin_area"] / statistics["area"], threshold
+                )
+            else:
+                message_body += "\n\t" + catalog.i18nc("@info:status", "no walls are thinner than %.2f mm") % threshold
+
+        self._message.hide()
+        self._message.setText(message_body)
+        self._message.show()
+
     @pyqtSlot()
     def fixSimpleHolesForMeshes(self) -> None:
-        nodes_list = self._getAllSelectedNodes()
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
         if not nodes_list:
             return
 
-        for node in nodes_list:
-            tri_node = self._toTriMesh(node.getMeshData())
+        node_groups = self._groupNodesByMeshData(nodes_list)
+        saved_bytes = 0
+
+        op = BatchedGroupedOperation()
+        for node_group in node_groups:
+            mesh_data = node_group[0].getMeshData()
+            tri_node = self._toTriMesh(mesh_data)
             success = tri_node.fill_holes()
-            self._replaceSceneNode(node, [tri_node])
+
+            # all nodes with the same mesh share the repaired meshdata
+            new_mesh_data = self._toMeshData(tri_node, mesh_data.getFileName())
+            for node in node_group:
+                op.addOperation(SetMeshDataAndNameOperation(node, new_mesh_data, node.getName()))
+            saved_bytes += (len(node_group) - 1) * self._getMeshDataSize(new_mesh_data)
+
             if not success:
                 self._message.setText(catalog.i18nc(
                     "@info:status",
                     "The mesh needs more extensive repair to become watertight"
                 ))
                 self._message.show()
+        op.push()
+
+        self._showDeduplicationSummary(len(nodes_list), len(node_groups), saved_bytes)
 
     @pyqtSlot()
     def fixNormalsForMeshes(self) -> None:
-        nodes_list = self._getAllSelectedNodes()
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
         if not nodes_list:
             return
 
-        for node in nodes_list:
-            tri_node = self._toTriMesh(node.getMeshData())
-            tri_node.fix_normals()
-            self._replaceSceneNode(node, [tri_node])
+        node_groups = self._groupNodesByMeshData(nodes_list)
+        saved_bytes = 0
+
+        op = BatchedGroupedOperation()
+        for node_group in node_groups:
+            mesh_data = node_group[0].getMeshData()
+            tri_node = self._toTriMesh(mesh_data)
+            flipped_faces = self._fixNormals(tri_node)
+            if not numpy.any(flipped_faces):
+                continue
+
+            # all nodes with the same mesh share the fixed meshdata
+            if len(tri_node.faces) != mesh_data.getFaceCount():
+                # the faces of the trimesh no longer match the faces of the meshdata
+                new_mesh_data = self._toMeshData(tri_node, mesh_data.getFileName())
+            else:
+                new_mesh_data = self._flipMeshDataFaces(mesh_data, flipped_faces)
+            for node in node_group:
+                op.addOperation(SetMeshDataAndNameOperation(node, new_mesh_data, node.getName()))
+            saved_bytes += (len(node_group) - 1) * self._getMeshDataSize(new_mesh_data)
+        if op.getNumChildrenOperations() > 0:
+            op.push()
+
+        self._showDeduplicationSummary(len(nodes_list), len(node_groups), saved_bytes)
 
     @pyqtSlot()
     def splitMeshes(self) -> None:
@@ -376,19 +587,179 @@ class MeshTools(Extension, QObject,):
         if not nodes_list:
             return
 
+        merge_fragments = self._preferences.getValue("meshtools/merge_fragments")
+
         message_body = catalog.i18nc("@info:status", "Split result:")
         for node in nodes_list:
             message_body = message_body + "\n - %s" % node.getName()
             tri_node = self._toTriMesh(node.getMeshData())
-            if tri_node.body_count > 1:
-                self._replaceSceneNode(node, tri_node.split(only_watertight=False))
-                message_body = message_body + " " + catalog.i18nc("@info:status", "was split in %d submeshes") % tri_node.body_count
+            components, fragment_count, fragment_face_count = self._filterFragments(tri_node, merge_fragments)
+            if len(components) > 1 or (fragment_count > 0 and not merge_fragments):
+                self._replaceSceneNode(node, tri_node.submesh(components, only_watertight=False))
+
+            if len(components) > 1:
+                message_body = message_body + " " + catalog.i18nc("@info:status", "was split in %d submeshes") % len(components)
             else:
                 message_body = message_body + " " + catalog.i18nc("@info:status", "could not be split into submeshes")
+            message_body += self._fragmentsSummary(fragment_count, fragment_face_count, merge_fragments)
 
         self._message.setText(message_body)
         self._message.show()
 
+    @pyqtSlot()
+    def removeFragmentsFromMeshes(self) -> None:
+        nodes_list = self._getAllSelectedNodes()
+        if not nodes_list:
+            return
+
+        message_body = catalog.i18nc("@info:status", "Cleanup result:")
+        for node in nodes_list:
+            message_body = message_body + "\n - %s" % node.getName()
+            tri_node = self._toTriMesh(node.getMeshData())
+            components, fragment_count, fragment_face_count = self._filterFragments(tri_node, False)
+            if fragment_count > 0:
+                self._replaceSceneNode(node, [tri_node.submesh(components, only_watertight=False, append=True)])
+                message_body += self._fragmentsSummary(fragment_count, fragment_face_count, False)
+            else:
+                message_body = message_body + " " + catalog.i18nc("@info:status", "has no small fragments")
+
+        self._message.setText(message_body)
+        self._message.show()
+
+    ##  Labels the connected components of a mesh, and separates the small fragments from the other components.
+    #
+    #   Components with fewer faces, a smaller volume or a smaller largest dimension than the thresholds set in the
+    #   preferences are considered fragments. If all components are fragments, the largest one is kept.
+    #   \param merge_fragments Whether to add the faces of the fragments to the largest remaining component
+    #   instead of discarding them.
+    #   \return The face indices of each remaining component, the number of fragments and their total number of faces.
+    def _filterFragments(self, tri_node: trimesh.base.Trimesh, merge_fragments: bool) -> Tuple[List[numpy.ndarray], int, int]:
+        face_total = len(tri_node.faces)
+        if face_total == 0:
+            return [], 0, 0
+
+        labels = trimesh.graph.connected_component_labels(tri_node.face_adjacency, node_count=face_total)
+        face_counts = numpy.bincount(labels)
+        face_order = numpy.argsort(labels, kind="stable")
+        component_starts = numpy.cumsum(face_counts) - face_counts
+
+        triangles = tri_node.triangles
+        volumes = numpy.abs(numpy.bincount(
+            labels,
+            weights=numpy.einsum("ij,ij->i", triangles[:, 0], numpy.cross(triangles[:, 1], triangles[:, 2])) / 6
+        ))
+        mins = numpy.minimum.reduceat(triangles.min(axis=1)[face_order], component_starts, axis=0)
+        maxs = numpy.maximum.reduceat(triangles.max(axis=1)[face_order], component_starts, axis=0)
+        sizes = (maxs - mins).max(axis=1)
+
+        fragments = (
+            (face_counts < float(self._preferences.getValue("meshtools/fragment_min_faces"))) |
+            (volumes < float(self._preferences.getValue("meshtools/fragment_min_volume"))) |
+            (sizes < float(self._preferences.getValue("meshtools/fragment_min_size")))
+        )
+        if numpy.all(fragments):
+            fragments[numpy.argmax(face_counts)] = False
+
+        component_faces = numpy.split(face_order, component_starts[1:])
+        components = [faces for faces, fragment in zip(component_faces, fragments) if not fragment]
+        fragment_count = int(numpy.count_nonzero(fragments))
+        fragment_face_count = int(face_counts[fragments].sum())
+
+        if merge_fragments and fragment_count > 0:
+            largest = int(numpy.argmax([len(faces) for faces in components]))
+            components[largest] = numpy.concatenate(
+                [components[largest]] + [faces for faces, fragment in zip(component_faces, fragments) if fragment]
+            )
+
+        return components, fragment_count, fragment_face_count
+
+    def _fragmentsSummary(self, fragment_count: int, fragment_face_count: int, merge_fragments: bool) -> str:
+        if fragment_count == 0:
+            return ""
+        if merge_fragments:
+            return ", " + catalog.i18nc("@info:status", "%d small fragments were merged into the largest part") % fragment_count
+
+        # each face is stored as three vertices with a normal each, and three indices
+        saved_bytes = fragment_face_count * (3 * (3 * 4 + 3 * 4) + 3 * 4)
+        return ", " + catalog.i18nc("@info:status", "%d small fragments with %d faces were removed, saving %.1f MB") % (
+            fragment_count, fragment_face_count, saved_bytes / (1024 * 1024)
+        )
+
+    @pyqtSlot()
+    def combineMeshes(self) -> None:
+        selected_nodes = self._getSelectedNodes()
+        if not selected_nodes:
+            return
+
+        # groups are combined by combining the models they contain
+        nodes_list = [node for node in self._getAllSelectedNodes() if node.getMeshData()]
+        if len(nodes_list) < 2:
+            self._message.setText(catalog.i18nc("@info:status", "Please select two or more models first"))
+            self._message.show()
+            return
+
+        vertices, indices = self._combineMeshData(nodes_list)
+
+        # Put the origin of the combined mesh at the center of its bounding box
+        center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+        vertices -= center
+        normals = calculateVertexNormals(vertices, indices)
+        mesh_data = MeshData(file_name = "", vertices = vertices, indices = indices, normals = normals)
+
+        new_transformation = Matrix()
+        new_transformation.setByTranslation(Vector(center[0], center[1], center[2]))
+
+        # The combined mesh is stored in a new node, so the operation can be undone by restoring the selected nodes
+        first_node = nodes_list[0]
+        new_node = CuraSceneNode()
+        new_node.setSelectable(True)
+        new_node.setMeshData(mesh_data)
+        new_node.setName(first_node.getName())
+        new_node.callDecoration("setActiveExtruder", first_node.callDecoration("getActiveExtruder"))
+        new_node.addDecorator(BuildPlateDecorator(first_node.callDecoration("getBuildPlateNumber")))
+        new_node.addDecorator(SliceableObjectDecorator())
+
+        op = BatchedGroupedOperation()
+        for node in selected_nodes:
+            op.addOperation(RemoveSceneNodeOperation(node))
+        op.addOperation(AddSceneNodeOperation(new_node, self._controller.getScene().getRoot()))
+        op.addOperation(SetTransformMatrixOperation(new_node, new_transformation))
+        op.push()
+
+        Selection.clear()
+        Selection.add(new_node)
+
+        self._message.setText(catalog.i18nc("@info:status", "Combined %d models into a single mesh") % len(nodes_list))
+        self._message.show()
+
+    def _combineMeshData(self, nodes_list: List[SceneNode]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        vertices_list = []  # type: List[numpy.ndarray]
+        indices_list = []  # type: List[numpy.ndarray]
+        for node in nodes_list:
+            mesh_data = node.getMeshData()
+            transformation = node.getWorldTransformation().getData()
+
+            vertices = mesh_data.getVertices()
+            vertices_list.append(numpy.dot(vertices, transformation[0:3, 0:3].T) + transformation[0:3, 3])
+
+            indices = mesh_data.getIndices()
+            if indices is None:
+                # some file formats (eg 3mf) don't supply indices, but have unique vertices per face
+                indices = numpy.arange(mesh_data.getVertexCount()).reshape(-1, 3)
+            if numpy.linalg.det(transformation[0:3, 0:3]) < 0:
+                # mirrored nodes would be inside out if the winding of their faces was kept
+                indices = indices[:, ::-1]
+            indices_list.append(indices)
+
+        # offset the indices of each mesh by the number of vertices of the meshes before it
+        vertex_counts = numpy.array([len(vertices) for vertices in vertices_list])
+        face_counts = numpy.array([len(indices) for indices in indices_list])
+        offsets = numpy.repeat(numpy.cumsum(vertex_counts) - vertex_counts, face_counts)
+
+        vertices = numpy.concatenate(vertices_list).astype(numpy.float32)
+        indices = (numpy.concatenate(indices_list) + offsets[:, numpy.newaxis]).astype(numpy.int32)
+        return vertices, indices
+
     @pyqtSlot()
     def replaceMeshes(self) -> None:
         self._node_queue = self._getSelectedNodes()
@@ -436,9 +807,7 @@ class MeshTools(Extension, QObject,):
             self._node_queue = [] #type: List[SceneNode]
             return
 
-        job = ReadMeshJob(file_name)
-        job.finished.connect(self._readMeshFinished)
-        job.start()
+        self._readMesh(file_name)
 
     @pyqtSlot()
     def renameMesh(self) -> None:
@@ -485,10 +854,29 @@ class MeshTools(Extension, QObject,):
             self._node_queue = [] #type: List[SceneNode]
             return
 
-        job = ReadMeshJob(file_name)
-        job.finished.connect(self._readMeshFinished)
+        self._readMesh(file_name)
+
+    def _readMesh(self, file_name: str) -> None:
+        if os.path.splitext(file_name)[1].lower() == ".stl":
+            # binary STL files can be read much faster and with less memory than through the regular mesh readers
+            job = ReadBinaryStlJob(file_name)
+            job.finished.connect(self._readBinaryStlFinished)
+        else:
+            job = ReadMeshJob(file_name)
+            job.finished.connect(self._readMeshFinished)
         job.start()
 
+    def _readBinaryStlFinished(self, job) -> None:
+        mesh_data = job.getResult()
+        if not mesh_data:
+            # not a binary STL file; fall back to the regular mesh readers
+            fallback_job = ReadMeshJob(job.getFileName())
+            fallback_job.finished.connect(self._readMeshFinished)
+            fallback_job.start()
+            return
+
+        self._setQueuedMeshData(mesh_data)
+
     def _readMeshFinished(self, job) -> None:
         job_result = job.getResult()
         if len(job_result) == 0:
@@ -504,6 +892,9 @@ class MeshTools(Extension, QObject,):
             self._node_queue = [] #type: List[SceneNode]
             return
 
+        self._setQueuedMeshData(mesh_data)
+
+    def _setQueuedMeshData(self, mesh_data: MeshData) -> None:
         file_name = mesh_data.getFileName()
         if file_name:
             mesh_name = os.path.basename(file_name)
@@ -512,7 +903,7 @@ class MeshTools(Extension, QObject,):
 
         has_merged_nodes = False
 
-        op = GroupedOperation()
+        op = BatchedGroupedOperation()
         for node in self._node_queue:
             op.addOperation(SetMeshDataAndNameOperation(node, mesh_data, mesh_name))
 
@@ -540,7 +931,7 @@ class MeshTools(Extension, QObject,):
         max_x_coordinate = (global_container_stack.getProperty("machine_width", "value") / 2) - disallowed_edge
         max_y_coordinate = (global_container_stack.getProperty("machine_depth", "value") / 2) - disallowed_edge
 
-        op = GroupedOperation()
+        op = BatchedGroupedOperation()
         for node in nodes_list:
             node_bounds = node.getBoundingBox()
             position = self._randomLocation(node_bounds, max_x_coordinate, max_y_coordinate)
@@ -560,11 +951,19 @@ class MeshTools(Extension, QObject,):
         if not nodes_list:
             return
 
-        op = GroupedOperation()
+        nodes_list = [node for node in nodes_list if node.getMeshData()]
+
+        # nodes with the same mesh that are rotated and scaled the same way share the transformed meshdata
+        def getRotationAndScale(node: SceneNode) -> bytes:
+            return node.getLocalTransformation().getData()[0:3, 0:3].tobytes()
+        node_groups = self._groupNodesByMeshData(nodes_list, getRotationAndScale)
+        group_leaders = {node: node_group[0] for node_group in node_groups for node in node_group}
+        transformed_mesh_datas = {}  # type: Dict[SceneNode, MeshData]
+        saved_bytes = 0
+
+        op = BatchedGroupedOperation()
         for node in nodes_list:
             mesh_data = node.getMeshData()
-            if not mesh_data:
-                continue
             mesh_name = node.getName()
             if not mesh_name:
                 file_name = mesh_data.getFileName()
@@ -577,7 +976,13 @@ class MeshTools(Extension, QObject,):
             local_transformation = node.getLocalTransformation()
             position = local_transformation.getTranslation()
             local_transformation.setTranslation(Vector(0,0,0))
-            transformed_mesh_data = mesh_data.getTransformed(local_transformation)
+            group_leader = group_leaders[node]
+            if group_leader in transformed_mesh_datas:
+                transformed_mesh_data = transformed_mesh_datas[group_leader]
+                saved_bytes += self._getMeshDataSize(transformed_mesh_data)
+            else:
+                transformed_mesh_data = mesh_data.getTransformed(local_transformation)
+                transformed_mesh_datas[group_leader] = transformed_mesh_data
             new_transformation = Matrix()
             new_transformation.setTranslation(position)
 
@@ -586,6 +991,8 @@ class MeshTools(Extension, QObject,):
 
         op.push()
 
+        self._showDeduplicationSummary(len(nodes_list), len(node_groups), saved_bytes)
+
 
     @pyqtSlot()
     def resetMeshOrigin(self) -> None:
@@ -593,7 +1000,7 @@ class MeshTools(Extension, QObject,):
         if not nodes_list:
             return
 
-        op = GroupedOperation()
+        op = BatchedGroupedOperation()
         for node in nodes_list:
             mesh_data = node.getMeshData()
             if not mesh_data:
@@ -615,6 +1022,124 @@ class MeshTools(Extension, QObject,):
         op.push()
 
 
+    ##  Groups nodes that have identical meshes, so each mesh only has to be processed once.
+    #
+    #   \param extra_key Optional function that returns additional data that has to be equal for nodes to be grouped.
+    #   \return The groups of nodes, in the order in which their first node appears in the list.
+    def _groupNodesByMeshData(self, nodes_list: List[SceneNode], extra_key: Optional[Callable[[SceneNode], Any]] = None) -> List[List[SceneNode]]:
+        node_groups = {}  # type: Dict[Any, List[SceneNode]]
+        mesh_hashes = {}  # type: Dict[int, str]
+        for node in nodes_list:
+            mesh_data = node.getMeshData()
+            # duplicated nodes usually share the same meshdata object, which then only needs to be hashed once
+            if id(mesh_data) not in mesh_hashes:
+                mesh_hashes[id(mesh_data)] = MeshCheckCache.getMeshHash(mesh_data)
+            key = (mesh_hashes[id(mesh_data)], extra_key(node) if extra_key else None)
+            node_groups.setdefault(key, []).append(node)
+        return list(node_groups.values())
+
+    def _getMeshDataSize(self, mesh_data: MeshData) -> int:
+        size = 0
+        for buffer in (mesh_data.getVertices(), mesh_data.getNormals(), mesh_data.getIndices()):
+            if buffer is not None:
+                size += buffer.nbytes
+        return size
+
+    def _showDeduplicationSummary(self, node_count: int, unique_count: int, saved_bytes: int) -> None:
+        if unique_count >= node_count:
+            return
+
+        message = Message(title=catalog.i18nc("@info:title", "Mesh Tools"))
+        message.setText(catalog.i18nc(
+            "@info:status",
+            "%d models share %d unique meshes, which were processed once each, saving %.1f MB"
+        ) % (node_count, unique_count, saved_bytes / (1024 * 1024)))
+        message.show()
+
+    ##  Fixes the winding and orientation of the faces of a mesh, per connected component.
+    #
+    #   Only the components that have inconsistent winding or are inside out are fixed.
+    #   \return A boolean array with the faces that were flipped.
+    def _fixNormals(self, tri_node: trimesh.base.Trimesh) -> numpy.ndarray:
+        original_faces = tri_node.faces.copy()
+        labels = trimesh.graph.connected_component_labels(tri_node.face_adjacency, node_count=len(original_faces))
+        components = self._componentsWithInvalidNormals(tri_node, labels)
+        if len(components) == 0:
+            return numpy.zeros(len(original_faces), dtype=bool)
+
+        # group the indices of the faces per component
+        face_order = numpy.argsort(labels, kind="stable")
+        component_faces = numpy.split(face_order, numpy.cumsum(numpy.bincount(labels))[:-1])
+
+        def fixComponent(face_indices: numpy.ndarray) -> numpy.ndarray:
+            component = trimesh.base.Trimesh(vertices=tri_node.vertices, faces=original_faces[face_indices], process=False)
+            component.fix_normals(multibody=False)
+            return component.faces
+
+        components_faces = [component_faces[component] for component in components]
+        if len(components_faces) > 1:
+            with ThreadPoolExecutor() as executor:
+                fixed_faces = list(executor.map(fixComponent, components_faces))
+        else:
+            fixed_faces = [fixComponent(components_faces[0])]
+
+        new_faces = original_faces.copy()
+        for face_indices, faces in zip(components_faces, fixed_faces):
+            new_faces[face_indices] = faces
+        tri_node.faces = new_faces
+
+        return numpy.any(new_faces != original_faces, axis=1)
+
+    def _componentsWithInvalidNormals(self, tri_node: trimesh.base.Trimesh, labels: numpy.ndarray) -> numpy.ndarray:
+        faces = tri_node.faces
+        component_count = labels.max() + 1 if len(labels) else 0
+
+        # faces have a consistent winding if they traverse their shared edge in opposite directions
+        adjacency = tri_node.face_adjacency
+        edges = tri_node.face_adjacency_edges
+        traverses_edge = []
+        for side in range(2):
+            adjacent_faces = faces[adjacency[:, side]]
+            traverses_edge.append(numpy.any(
+                (adjacent_faces == edges[:, 0:1]) & (numpy.roll(adjacent_faces, -1, axis=1) == edges[:, 1:2]),
+                axis=1
+            ))
+        inconsistent = numpy.unique(labels[adjacency[traverses_edge[0] == traverses_edge[1], 0]])
+
+        # closed components with a negative volume are inside out
+        triangles = tri_node.triangles
+        volumes = numpy.bincount(
+            labels,
+            weights=numpy.einsum("ij,ij->i", triangles[:, 0], numpy.cross(triangles[:, 1], triangles[:, 2])),
+            minlength=component_count
+        )
+        closed = numpy.ones(component_count, dtype=bool)
+        open_edges = trimesh.grouping.group_rows(tri_node.edges_sorted, require_count=1)
+        closed[labels[tri_node.edges_face[open_edges]]] = False
+        inverted = numpy.nonzero(closed & (volumes < 0))[0]
+
+        return numpy.union1d(inconsistent, inverted)
+
+    ##  Reverses the winding of some faces of a meshdata, keeping the other faces and vertices as they are.
+    def _flipMeshDataFaces(self, mesh_data: MeshData, flipped_faces: numpy.ndarray) -> MeshData:
+        indices = mesh_data.getIndices()
+        if indices is not None:
+            indices = indices.copy()
+            indices[flipped_faces] = indices[flipped_faces, ::-1]
+            # only the normals of the vertices of the flipped faces change
+            normals = calculateVertexNormals(mesh_data.getVertices(), indices, flipped_faces, mesh_data.getNormals())
+            return mesh_data.set(indices=indices, normals=normals)
+
+        # without indices, each face has its own three vertices
+        vertices = mesh_data.getVertices().reshape(-1, 3, 3).copy()
+        vertices[flipped_faces] = vertices[flipped_faces, ::-1]
+        normals = mesh_data.getNormals()
+        if normals is not None:
+            normals = normals.reshape(-1, 3, 3).copy()
+            normals[flipped_faces] = -normals[flipped_faces, ::-1]
+            normals = normals.reshape(-1, 3)
+        return mesh_data.set(vertices=vertices.reshape(-1, 3), normals=normals)
+
     def _replaceSceneNode(self, existing_node, trimeshes) -> None:
         name = existing_node.getName()
         file_name = existing_node.getMeshData().getFileName()
@@ -627,7 +1152,7 @@ class MeshTools(Extension, QObject,):
         children = existing_node.getChildren()
         new_nodes = []
 
-        op = GroupedOperation()
+        op = BatchedGroupedOperation()
         op.addOperation(RemoveSceneNodeOperation(existing_node))
 
         for i, tri_node in enumerate(trimeshes):
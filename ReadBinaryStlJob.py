@@ -0,0 +1,109 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+from UM.Job import Job
+from UM.Logger import Logger
+from UM.Math.Vector import Vector
+from UM.Mesh.MeshData import MeshData
+
+from .MeshNormals import calculateVertexNormals
+
+import os
+import numpy
+
+from typing import List, Tuple
+
+# Each triangle in a binary STL file is a record of a normal, three vertices and a 2 byte attribute
+STL_HEADER_SIZE = 84
+STL_RECORD_DTYPE = numpy.dtype([
+    ("normal", "<f4", (3, )),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2")
+])
+
+##  Job that reads a binary STL file directly into meshdata.
+#
+#   The file is memory-mapped, and the triangle records are viewed as a structured numpy array without copying
+#   them. The vertices are welded in chunks, so the temporary memory use stays small compared to the file size.
+#   The result of the job is the meshdata, or None if the file is not a binary STL file or could not be read.
+class ReadBinaryStlJob(Job):
+    ##  Creates the job.
+    #
+    #   \param file_name The path of the file to read.
+    #   \param chunk_size The number of triangles to weld at once.
+    def __init__(self, file_name: str, chunk_size: int = 1048576) -> None:
+        super().__init__()
+
+        self._file_name = file_name
+        self._chunk_size = chunk_size
+
+    def getFileName(self) -> str:
+        return self._file_name
+
+    def run(self) -> None:
+        try:
+            self.setResult(self._read())
+        except (OSError, ValueError) as e:
+            Logger.log("w", "Could not read %s as a binary STL file: %s" % (self._file_name, str(e)))
+            self.setResult(None)
+
+    def _read(self) -> MeshData:
+        file_size = os.path.getsize(self._file_name)
+        if file_size < STL_HEADER_SIZE:
+            raise ValueError("File is too small")
+
+        with open(self._file_name, "rb") as stl_file:
+            stl_file.seek(80)
+            face_count = int(numpy.frombuffer(stl_file.read(4), dtype="<u4")[0])
+        if face_count == 0 or file_size != STL_HEADER_SIZE + face_count * STL_RECORD_DTYPE.itemsize:
+            # ASCII STL files (and broken binary files) don't have the size the header promises
+            raise ValueError("File is not a binary STL file")
+
+        records = numpy.memmap(self._file_name, dtype=STL_RECORD_DTYPE, mode="r", offset=STL_HEADER_SIZE, shape=(face_count, ))
+        try:
+            vertices, indices = self._weldVertices(records["vertices"])
+        finally:
+            del records
+
+        # Swap Y and Z, because Cura uses a Y-up coordinate system
+        vertices = numpy.column_stack((vertices[:, 0], vertices[:, 2], -vertices[:, 1]))
+
+        # Center the mesh, as the regular mesh readers do
+        center = (vertices.min(axis=0) + vertices.max(axis=0)) / 2
+        vertices -= center
+
+        normals = calculateVertexNormals(vertices, indices)
+        return MeshData(
+            vertices=vertices, indices=indices, normals=normals, file_name=self._file_name,
+            center_position=Vector(center[0], center[1], center[2])
+        )
+
+    ##  Merges identical vertices of the triangles.
+    #
+    #   Each chunk of triangles is welded on its own first, after which the unique vertices of all chunks are welded.
+    #   \return The unique vertices, and the indices of the vertices of each triangle.
+    def _weldVertices(self, triangles: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        vertex_key_dtype = numpy.dtype((numpy.void, 3 * 4))
+
+        chunk_keys = []  # type: List[numpy.ndarray]
+        chunk_inverses = []  # type: List[numpy.ndarray]
+        for start in range(0, len(triangles), self._chunk_size):
+            # adding 0 turns -0.0 into 0.0, so both are welded
+            chunk = numpy.ascontiguousarray(triangles[start:start + self._chunk_size].reshape(-1, 3), dtype=numpy.float32) + numpy.float32(0)
+            keys, inverse = numpy.unique(chunk.view(vertex_key_dtype).ravel(), return_inverse=True)
+            chunk_keys.append(keys)
+            chunk_inverses.append(inverse.ravel())
+
+        keys, key_inverse = numpy.unique(numpy.concatenate(chunk_keys), return_inverse=True)
+        key_inverse = key_inverse.ravel()
+
+        indices = numpy.empty(len(triangles) * 3, dtype=numpy.int32)
+        vertex_offset = 0
+        key_offset = 0
+        for chunk_key, chunk_inverse in zip(chunk_keys, chunk_inverses):
+            indices[vertex_offset:vertex_offset + len(chunk_inverse)] = key_inverse[key_offset + chunk_inverse]
+            vertex_offset += len(chunk_inverse)
+            key_offset += len(chunk_key)
+
+        vertices = keys.view(numpy.float32).reshape(-1, 3)
+        return vertices, indices.reshape(-1, 3)
@@ -0,0 +1,38 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+from UM.Job import Job
+from UM.Mesh.MeshData import MeshData
+from UM.Scene.SceneNode import SceneNode
+
+from .MeshBVH import MeshBVH
+
+import trimesh
+import numpy
+
+from typing import Callable, Dict, List, Optional
+
+##  Job that finds the self-intersecting faces of the meshes of a list of nodes.
+#
+#   Nodes are passed in groups of nodes with identical meshes, so each mesh is only checked once.
+#   The result of the job is a dictionary with the indices of the intersecting faces for each node.
+class SelfIntersectionJob(Job):
+    ##  Creates the job.
+    #
+    #   \param node_groups The scene nodes to check, grouped by identical meshes.
+    #   \param to_tri_mesh A function to convert the meshdata of a node to a trimesh.
+    def __init__(self, node_groups: List[List[SceneNode]], to_tri_mesh: Callable[[Optional[MeshData]], trimesh.base.Trimesh]) -> None:
+        super().__init__()
+
+        self._node_groups = node_groups
+        self._to_tri_mesh = to_tri_mesh
+
+    def run(self) -> None:
+        result = {}  # type: Dict[SceneNode, numpy.ndarray]
+        for node_group in self._node_groups:
+            tri_node = self._to_tri_mesh(node_group[0].getMeshData())
+            intersecting_faces = MeshBVH(tri_node.vertices, tri_node.faces).selfIntersectingFaces()
+            for node in node_group:
+                result[node] = intersecting_faces
+
+        self.setResult(result)
@@ -8,11 +8,14 @@ from UM.Scene.SceneNode import SceneNode
 from typing import Union
 
 ##  Operation that replaces the meshdata of a node.
+#
+#   The change is only applied when the operation is pushed onto the operation stack.
 class SetMeshDataAndNameOperation(Operation):
-    ##  Creates the transform operation.
+    ##  Creates the operation.
     #
-    #   \param node The scene node to transform.
-    #   \param transform A fully formed transformation matrix to transform the node with.
+    #   \param node The scene node to change.
+    #   \param mesh_data The new meshdata for the node.
+    #   \param name The new name for the node.
     def __init__(self, node: SceneNode, mesh_data: MeshData, name: str = "") -> None:
         super().__init__()
 
@@ -24,9 +27,6 @@ class SetMeshDataAndNameOperation(Operation):
         self._new_mesh_data = mesh_data
         self._new_name = name
 
-        if mesh_data.getVertices != None:
-            self.redo()
-
     ##  Undoes the mesh data change, restoring the node to the old state.
     def undo(self) -> None:
 
@@ -56,11 +56,9 @@ class SetMeshDataAndNameOperation(Operation):
         if other._node != self._node: # Must be on the same node.
             return False
 
-        op = SetMeshDataAndNameOperation(self._node, MeshData())
+        op = SetMeshDataAndNameOperation(self._node, self._new_mesh_data, self._new_name)
         op._old_mesh_data = other._old_mesh_data
         op._old_name = other._old_name
-        op._new_mesh_data = self._new_mesh_data
-        op._new_name = self._new_name
 
         return op
 
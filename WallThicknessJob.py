@@ -0,0 +1,131 @@
+# Copyright (c) 2023 Aldo Hoeben / fieldOfView
+# MeshTools is released under the terms of the AGPLv3 or higher.
+
+from UM.Job import Job
+from UM.Message import Message
+from UM.Scene.SceneNode import SceneNode
+
+from .MeshBVH import MeshBVH
+
+import numpy
+
+from typing import Any, Dict, List, Optional
+
+##  Job that measures the wall thickness of the meshes of a list of nodes.
+#
+#   Rays are cast inwards from the centers of a sample of the faces, and the distance to the first face they hit
+#   is taken as the thickness of the wall at that face. Walls thicker than a multiple of the threshold are not
+#   measured exactly, which allows the ray casting to skip most of the mesh.
+#   The result of the job is a dictionary with the statistics for each node, or None if the job was aborted.
+class WallThicknessJob(Job):
+    ##  Creates the job.
+    #
+    #   \param nodes The scene nodes to analyse.
+    #   \param threshold The thickness in mm below which walls are considered too thin.
+    #   \param message The message to show the progress in.
+    #   \param sample_count The maximum number of faces per mesh to cast rays from.
+    #   \param batch_size The number of rays to cast at once.
+    def __init__(self, nodes: List[SceneNode], threshold: float, message: Optional[Message] = None, sample_count: int = 100000, batch_size: int = 8192) -> None:
+        super().__init__()
+
+        self._nodes = nodes
+        self._threshold = threshold
+        self._message = message
+        self._sample_count = sample_count
+        self._batch_size = batch_size
+
+        self._aborted = False
+
+    def getMessage(self) -> Optional[Message]:
+        return self._message
+
+    def getThreshold(self) -> float:
+        return self._threshold
+
+    def getMaximumThickness(self) -> float:
+        return self._threshold * 10
+
+    ##  Stops the job after the current batch of rays.
+    def abort(self) -> None:
+        self._aborted = True
+
+    def isAborted(self) -> bool:
+        return self._aborted
+
+    def run(self) -> None:
+        result = {}  # type: Dict[SceneNode, Dict[str, Any]]
+        for node_number, node in enumerate(self._nodes):
+            if not node.getMeshData():
+                continue
+            statistics = self._analyseNode(node, node_number)
+            if statistics is None:
+                self.setResult(None)
+                return
+            result[node] = statistics
+
+        self.setResult(result)
+
+    def _analyseNode(self, node: SceneNode, node_number: int) -> Optional[Dict[str, Any]]:
+        # getMeshDataTransformed() does not keep the indices of the mesh
+        mesh_data = node.getMeshData().getTransformed(node.getWorldTransformation())
+        vertices = mesh_data.getVertices()
+        indices = mesh_data.getIndices()
+        if indices is None:
+            # some file formats (eg 3mf) don't supply indices, but have unique vertices per face
+            indices = numpy.arange(mesh_data.getVertexCount()).reshape(-1, 3)
+
+        triangles = vertices[indices].astype(numpy.float64)
+        normals = numpy.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        areas = numpy.linalg.norm(normals, axis=1) / 2
+        valid_faces = numpy.nonzero(areas > 0)[0]
+
+        # sample faces proportionally to their area, so each sample represents the same area of the surface
+        if len(valid_faces) > self._sample_count:
+            random_state = numpy.random.RandomState(0)
+            sample_probabilities = areas[valid_faces] / areas[valid_faces].sum()
+            sampled_faces = numpy.sort(random_state.choice(valid_faces, self._sample_count, p=sample_probabilities))
+            sample_weights = numpy.ones(len(sampled_faces))
+        else:
+            sampled_faces = valid_faces
+            sample_weights = areas[valid_faces]
+
+        bvh = MeshBVH(vertices, indices)
+
+        # start the rays just inside the surface, so they do not hit the face they start from
+        offset = 1e-4
+        directions = -normals[sampled_faces] / (2 * areas[sampled_faces, numpy.newaxis])
+        origins = triangles[sampled_faces].mean(axis=1) + directions * offset
+
+        thicknesses = numpy.empty(len(sampled_faces))
+        for start in range(0, len(sampled_faces), self._batch_size):
+            if self._aborted:
+                return None
+            end = start + self._batch_size
+            thicknesses[start:end] = bvh.intersectRays(origins[start:end], directions[start:end], self.getMaximumThickness()) + offset
+
+            if self._message:
+                progress = (node_number + end / max(len(sampled_faces), 1)) / len(self._nodes)
+                self._message.setProgress(min(progress, 1) * 100)
+
+        # estimate the area of thin walls from the sampled faces
+        total_weight = sample_weights.sum()
+        thin = thicknesses < self._threshold
+        thin_area = sample_weights[thin].sum() / total_weight * areas.sum() if total_weight > 0 else 0
+
+        # walls that are too thick to be measured are infinitely thick, so interpolating percentiles does not work
+        order = numpy.argsort(thicknesses)
+        sorted_thicknesses = thicknesses[order]
+        cumulative_weights = numpy.cumsum(sample_weights[order])
+        percentiles = {}  # type: Dict[int, float]
+        if len(sorted_thicknesses):
+            for percentile in (5, 25, 50):
+                index = numpy.searchsorted(cumulative_weights, total_weight * percentile / 100)
+                percentiles[percentile] = float(sorted_thicknesses[min(index, len(sorted_thicknesses) - 1)])
+
+        return {
+            "sample_count": len(sampled_faces),
+            "minimum": float(sorted_thicknesses[0]) if len(sorted_thicknesses) else numpy.inf,
+            "percentiles": percentiles,
+            "thin_area": float(thin_area),
+            "area": float(areas.sum())
+        }
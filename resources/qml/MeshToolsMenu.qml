@@ -46,6 +46,18 @@ Cura.Menu
             onTriggered: manager.analyseMeshes()
         }
         Cura.MenuItem
+        {
+            text: catalog.i18ncp("@item:inmenu", "Check mesh for self-intersections", "Check meshes for self-intersections", UM.Selection.selectionCount)
+            enabled: UM.Selection.hasSelection
+            onTriggered: manager.checkSelfIntersections()
+        }
+        Cura.MenuItem
+        {
+            text: catalog.i18nc("@item:inmenu", "Analyse wall thickness")
+            enabled: UM.Selection.hasSelection
+            onTriggered: manager.analyseWallThickness()
+        }
+        Cura.MenuItem
         {
             text: catalog.i18nc("@item:inmenu", "Fix simple holes")
             enabled: UM.Selection.hasSelection
@@ -63,6 +75,18 @@ Cura.Menu
             enabled: UM.Selection.hasSelection
             onTriggered: manager.splitMeshes()
         }
+        Cura.MenuItem
+        {
+            text: catalog.i18nc("@item:inmenu", "Remove small fragments")
+            enabled: UM.Selection.hasSelection
+            onTriggered: manager.removeFragmentsFromMeshes()
+        }
+        Cura.MenuItem
+        {
+            text: catalog.i18nc("@item:inmenu", "Combine models into single mesh")
+            enabled: UM.Selection.hasSelection
+            onTriggered: manager.combineMeshes()
+        }
         Cura.MenuSeparator {}
         Cura.MenuItem
         {
@@ -45,6 +45,18 @@ Menu
         onTriggered: manager.analyseMeshes()
     }
     MenuItem
+    {
+        text: catalog.i18ncp("@item:inmenu", "Check mesh for self-intersections", "Check meshes for self-intersections", UM.Selection.selectionCount)
+        enabled: UM.Selection.hasSelection
+        onTriggered: manager.checkSelfIntersections()
+    }
+    MenuItem
+    {
+        text: catalog.i18nc("@item:inmenu", "Analyse wall thickness")
+        enabled: UM.Selection.hasSelection
+        onTriggered: manager.analyseWallThickness()
+    }
+    MenuItem
     {
         text: catalog.i18nc("@item:inmenu", "Fix simple holes")
         enabled: UM.Selection.hasSelection
@@ -62,6 +74,18 @@ Menu
         enabled: UM.Selection.hasSelection
         onTriggered: manager.splitMeshes()
     }
+    MenuItem
+    {
+        text: catalog.i18nc("@item:inmenu", "Remove small fragments")
+        enabled: UM.Selection.hasSelection
+        onTriggered: manager.removeFragmentsFromMeshes()
+    }
+    MenuItem
+    {
+        text: catalog.i18nc("@item:inmenu", "Combine models into single mesh")
+        enabled: UM.Selection.hasSelection
+        onTriggered: manager.combineMeshes()
+    }
     MenuSeparator {}
     MenuItem
     {
@@ -146,6 +146,139 @@ UM.Dialog
                 onCheckedChanged: UM.Preferences.setValue("meshtools/randomise_location_on_load", checked)
             }
         }
+
+        // spacer
+        Item { height: UM.Theme.getSize("default_margin").height; width: 1 }
+
+        Label
+        {
+            text: catalog.i18nc("@window:text", "Small fragments when splitting models or removing fragments:")
+        }
+
+        UM.TooltipArea
+        {
+            width: childrenRect.width
+            height: childrenRect.height
+            text: catalog.i18nc("@info:tooltip", "Parts with fewer faces than this are considered fragments. Set to 0 to disable.")
+
+            Row
+            {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                Label
+                {
+                    width: 150 * screenScaleFactor
+                    anchors.verticalCenter: parent.verticalCenter
+                    text: catalog.i18nc("@window:text", "Minimum number of faces")
+                }
+
+                TextField
+                {
+                    width: 100 * screenScaleFactor
+                    text: UM.Preferences.getValue("meshtools/fragment_min_faces")
+                    validator: IntValidator { bottom: 0 }
+                    onEditingFinished: UM.Preferences.setValue("meshtools/fragment_min_faces", parseInt(text))
+                }
+            }
+        }
+
+        UM.TooltipArea
+        {
+            width: childrenRect.width
+            height: childrenRect.height
+            text: catalog.i18nc("@info:tooltip", "Parts with a smaller volume than this are considered fragments. Set to 0 to disable.")
+
+            Row
+            {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                Label
+                {
+                    width: 150 * screenScaleFactor
+                    anchors.verticalCenter: parent.verticalCenter
+                    text: catalog.i18nc("@window:text", "Minimum volume (mm3)")
+                }
+
+                TextField
+                {
+                    width: 100 * screenScaleFactor
+                    text: UM.Preferences.getValue("meshtools/fragment_min_volume")
+                    validator: DoubleValidator { bottom: 0 }
+                    onEditingFinished: UM.Preferences.setValue("meshtools/fragment_min_volume", parseFloat(text))
+                }
+            }
+        }
+
+        UM.TooltipArea
+        {
+            width: childrenRect.width
+            height: childrenRect.height
+            text: catalog.i18nc("@info:tooltip", "Parts that are smaller than this in every direction are considered fragments. Set to 0 to disable.")
+
+            Row
+            {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                Label
+                {
+                    width: 150 * screenScaleFactor
+                    anchors.verticalCenter: parent.verticalCenter
+                    text: catalog.i18nc("@window:text", "Minimum size (mm)")
+                }
+
+                TextField
+                {
+                    width: 100 * screenScaleFactor
+                    text: UM.Preferences.getValue("meshtools/fragment_min_size")
+                    validator: DoubleValidator { bottom: 0 }
+                    onEditingFinished: UM.Preferences.setValue("meshtools/fragment_min_size", parseFloat(text))
+                }
+            }
+        }
+
+        UM.TooltipArea
+        {
+            width: childrenRect.width
+            height: childrenRect.height
+            text: catalog.i18nc("@info:tooltip", "When splitting models, add small fragments to the largest part instead of removing them")
+
+            CheckBox
+            {
+                text: catalog.i18nc("@option:check", "Merge fragments into largest part")
+                checked: boolCheck(UM.Preferences.getValue("meshtools/merge_fragments"))
+                onCheckedChanged: UM.Preferences.setValue("meshtools/merge_fragments", checked)
+            }
+        }
+
+        // spacer
+        Item { height: UM.Theme.getSize("default_margin").height; width: 1 }
+
+        UM.TooltipArea
+        {
+            width: childrenRect.width
+            height: childrenRect.height
+            text: catalog.i18nc("@info:tooltip", "Walls thinner than this are reported by the wall thickness analysis")
+
+            Row
+            {
+                spacing: UM.Theme.getSize("default_margin").width
+
+                Label
+                {
+                    width: 150 * screenScaleFactor
+                    anchors.verticalCenter: parent.verticalCenter
+                    text: catalog.i18nc("@window:text", "Minimum wall thickness (mm)")
+                }
+
+                TextField
+                {
+                    width: 100 * screenScaleFactor
+                    text: UM.Preferences.getValue("meshtools/minimum_wall_thickness")
+                    validator: DoubleValidator { bottom: 0.01 }
+                    onEditingFinished: UM.Preferences.setValue("meshtools/minimum_wall_thickness", parseFloat(text))
+                }
+            }
+        }
     }
 
     rightButtons: [